@@ -15,7 +15,6 @@
 # limitations under the License.
 
 import logging
-from copy import deepcopy
 from typing import Dict, Generator, List, Optional
 
 from model_analyzer.config.generate.brute_run_config_generator import (
@@ -29,6 +28,7 @@
 from model_analyzer.config.run.run_config import RunConfig
 from model_analyzer.constants import LOGGER_NAME
 from model_analyzer.device.gpu_device import GPUDevice
+from model_analyzer.perf_analyzer.perf_config import PerfAnalyzerConfig
 from model_analyzer.result.parameter_search import ParameterSearch
 from model_analyzer.result.result_manager import ResultManager
 from model_analyzer.result.run_config_measurement import RunConfigMeasurement
@@ -75,6 +75,11 @@ def __init__(
         self._result_manager = result_manager
         self._model_variant_name_manager = model_variant_name_manager
 
+        self._can_binary_search = not any(
+            model.parameters()["concurrency"] or model.parameters()["request_rate"]
+            for model in models
+        )
+
     def set_last_results(
         self, measurements: List[Optional[RunConfigMeasurement]]
     ) -> None:
@@ -90,15 +95,17 @@ def get_configs(self) -> Generator[RunConfig, None, None]:
         """
 
         yield from self._execute_brute_search()
-        logger.info("")
-        logger.info("Done with brute mode search.")
-        logger.info("")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("")
+            logger.info("Done with brute mode search.")
+            logger.info("")
 
         if self._can_binary_search_top_results():
             yield from self._binary_search_over_top_results()
-            logger.info("")
-            logger.info("Done gathering concurrency sweep measurements for reports")
-            logger.info("")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("")
+                logger.info("Done gathering concurrency sweep measurements for reports")
+                logger.info("")
 
     def _execute_brute_search(self) -> Generator[RunConfig, None, None]:
         self._rcg: ConfigGeneratorInterface = self._create_brute_run_config_generator()
@@ -115,11 +122,7 @@ def _create_brute_run_config_generator(self) -> BruteRunConfigGenerator:
         )
 
     def _can_binary_search_top_results(self) -> bool:
-        for model in self._models:
-            if model.parameters()["concurrency"] or model.parameters()["request_rate"]:
-                return False
-
-        return True
+        return self._can_binary_search
 
     def _binary_search_over_top_results(self) -> Generator[RunConfig, None, None]:
         for model_name in self._result_manager.get_model_names():
@@ -129,17 +132,25 @@ def _binary_search_over_top_results(self) -> Generator[RunConfig, None, None]:
                 include_default=True,
             )
 
+            model_parameters = self._get_model_parameters(model_name)
+            parameter_is_request_rate = self._config.is_request_rate_specified(
+                model_parameters
+            )
+            parameter_search = ParameterSearch(
+                config=self._config,
+                model_parameters=model_parameters,
+                skip_parameter_sweep=True,
+            )
+
             for result in top_results:
-                run_config = deepcopy(result.run_config())
-                model_parameters = self._get_model_parameters(model_name)
-                parameter_search = ParameterSearch(
-                    config=self._config,
-                    model_parameters=model_parameters,
-                    skip_parameter_sweep=True,
-                )
+                run_config = result.run_config().copy_for_parameter_sweep()
+                perf_configs = [
+                    mrc.perf_config() for mrc in run_config.model_run_configs()
+                ]
+                parameter_search.reset()
                 for parameter in parameter_search.search_parameters():
-                    run_config = self._set_parameter(
-                        run_config, model_parameters, parameter
+                    self._set_parameter(
+                        perf_configs, parameter_is_request_rate, parameter
                     )
                     yield run_config
                     parameter_search.add_run_config_measurement(self._last_measurement)
@@ -152,13 +163,13 @@ def _get_model_parameters(self, model_name: str) -> Dict:
         return {}
 
     def _set_parameter(
-        self, run_config: RunConfig, model_parameters: Dict, parameter: int
-    ) -> RunConfig:
-        for model_run_config in run_config.model_run_configs():
-            perf_config = model_run_config.perf_config()
-            if self._config.is_request_rate_specified(model_parameters):
-                perf_config.update_config({"request-rate-range": parameter})
+        self,
+        perf_configs: List[PerfAnalyzerConfig],
+        parameter_is_request_rate: bool,
+        parameter: int,
+    ) -> None:
+        for perf_config in perf_configs:
+            if parameter_is_request_rate:
+                perf_config.set_request_rate_range(parameter)
             else:
-                perf_config.update_config({"concurrency-range": parameter})
-
-        return run_config
+                perf_config.set_concurrency_range(parameter)
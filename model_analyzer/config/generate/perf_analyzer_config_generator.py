@@ -185,7 +185,7 @@ def _create_request_rate_list(self) -> List[int]:
         else:
             return utils.generate_doubled_list(
                 self._cli_config.run_config_search_min_request_rate,
-                self._cli_config.run_config_search_max_request_rate,
+                self._cli_config.get_max_search_request_rate(),
             )
 
     def _create_concurrency_list(self) -> List[int]:
@@ -196,7 +196,7 @@ def _create_concurrency_list(self) -> List[int]:
         else:
             return utils.generate_doubled_list(
                 self._cli_config.run_config_search_min_concurrency,
-                self._cli_config.run_config_search_max_concurrency,
+                self._cli_config.get_max_search_concurrency(),
             )
 
     def _generate_perf_configs(self) -> None:
@@ -15,7 +15,6 @@
 # limitations under the License.
 
 import logging
-from copy import deepcopy
 from typing import Generator, List, Optional
 
 from model_analyzer.config.generate.model_profile_spec import ModelProfileSpec
@@ -30,6 +29,7 @@
 from model_analyzer.config.run.run_config import RunConfig
 from model_analyzer.constants import LOGGER_NAME
 from model_analyzer.device.gpu_device import GPUDevice
+from model_analyzer.perf_analyzer.perf_config import PerfAnalyzerConfig
 from model_analyzer.result.parameter_search import ParameterSearch
 from model_analyzer.result.result_manager import ResultManager
 from model_analyzer.result.run_config_measurement import RunConfigMeasurement
@@ -99,19 +99,22 @@ def get_configs(self) -> Generator[RunConfig, None, None]:
             The next RunConfig generated by this class
         """
 
-        logger.info("")
-        logger.info("Starting quick mode search to find optimal configs")
-        logger.info("")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("")
+            logger.info("Starting quick mode search to find optimal configs")
+            logger.info("")
         yield from self._execute_quick_search()
-        logger.info("")
-        logger.info(
-            "Done with quick mode search. Gathering concurrency sweep measurements for reports"
-        )
-        logger.info("")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("")
+            logger.info(
+                "Done with quick mode search. Gathering concurrency sweep measurements for reports"
+            )
+            logger.info("")
         yield from self._sweep_concurrency_over_top_results()
-        logger.info("")
-        logger.info("Done gathering concurrency sweep measurements for reports")
-        logger.info("")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("")
+            logger.info("Done gathering concurrency sweep measurements for reports")
+            logger.info("")
 
     def _execute_quick_search(self) -> Generator[RunConfig, None, None]:
         self._rcg: ConfigGeneratorInterface = self._create_quick_run_config_generator()
@@ -130,6 +133,8 @@ def _create_quick_run_config_generator(self) -> QuickRunConfigGenerator:
         )
 
     def _sweep_concurrency_over_top_results(self) -> Generator[RunConfig, None, None]:
+        parameter_search = ParameterSearch(self._config)
+
         for model_name in self._result_manager.get_model_names():
             top_results = self._result_manager.top_n_results(
                 model_name=model_name,
@@ -138,16 +143,18 @@ def _sweep_concurrency_over_top_results(self) -> Generator[RunConfig, None, None
             )
 
             for result in top_results:
-                run_config = deepcopy(result.run_config())
-                parameter_search = ParameterSearch(self._config)
+                run_config = result.run_config().copy_for_parameter_sweep()
+                perf_configs = [
+                    mrc.perf_config() for mrc in run_config.model_run_configs()
+                ]
+                parameter_search.reset()
                 for concurrency in parameter_search.search_parameters():
-                    run_config = self._set_concurrency(run_config, concurrency)
+                    self._set_concurrency(perf_configs, concurrency)
                     yield run_config
                     parameter_search.add_run_config_measurement(self._last_measurement)
 
-    def _set_concurrency(self, run_config: RunConfig, concurrency: int) -> RunConfig:
-        for model_run_config in run_config.model_run_configs():
-            perf_config = model_run_config.perf_config()
-            perf_config.update_config({"concurrency-range": concurrency})
-
-        return run_config
+    def _set_concurrency(
+        self, perf_configs: List[PerfAnalyzerConfig], concurrency: int
+    ) -> None:
+        for perf_config in perf_configs:
+            perf_config.set_concurrency_range(concurrency)
@@ -589,6 +589,13 @@ def _calculate_concurrency(
             "run_config_search_max_concurrency"
         ].is_set_by_user()
 
+        # The max is also enforced when it was lowered by the deployment
+        # target and/or a prior saturation point
+        max_concurrency = self._config.get_max_search_concurrency()
+        max_concurrency_is_limited = (
+            max_concurrency < self._config.run_config_search_max_concurrency
+        )
+
         if (
             min_concurrency_is_set_by_config
             and concurrency < self._config.run_config_search_min_concurrency
@@ -596,10 +603,9 @@ def _calculate_concurrency(
             return self._config.run_config_search_min_concurrency
 
         if (
-            max_concurrency_is_set_by_config
-            and concurrency > self._config.run_config_search_max_concurrency
-        ):
-            return self._config.run_config_search_max_concurrency
+            max_concurrency_is_set_by_config or max_concurrency_is_limited
+        ) and concurrency > max_concurrency:
+            return max_concurrency
 
         return concurrency
 
@@ -17,6 +17,8 @@
 import argparse
 import logging
 import os
+from math import log2
+from typing import Optional
 
 import numba.cuda
 import psutil
@@ -69,6 +71,7 @@
     DEFAULT_REQUEST_RATE_GPU_OUTPUT_FIELDS,
     DEFAULT_REQUEST_RATE_INFERENCE_OUTPUT_FIELDS,
     DEFAULT_REQUEST_RATE_SEARCH_ENABLE,
+    DEFAULT_RUN_CONFIG_CPU_MAX_CONCURRENCY,
     DEFAULT_RUN_CONFIG_MAX_BINARY_SEARCH_STEPS,
     DEFAULT_RUN_CONFIG_MAX_CONCURRENCY,
     DEFAULT_RUN_CONFIG_MAX_INSTANCE_COUNT,
@@ -79,8 +82,12 @@
     DEFAULT_RUN_CONFIG_MIN_MODEL_BATCH_SIZE,
     DEFAULT_RUN_CONFIG_MIN_REQUEST_RATE,
     DEFAULT_RUN_CONFIG_PROFILE_MODELS_CONCURRENTLY_ENABLE,
+    DEFAULT_RUN_CONFIG_SEARCH_DEPLOYMENT_TARGET,
     DEFAULT_RUN_CONFIG_SEARCH_DISABLE,
     DEFAULT_RUN_CONFIG_SEARCH_MODE,
+    DEFAULT_RUN_CONFIG_SEARCH_SATURATION_PRIOR,
+    DEFAULT_RUN_CONFIG_SEARCH_SATURATION_THRESHOLD,
+    DEFAULT_RUN_CONFIG_SEARCH_SATURATION_WINDOW,
     DEFAULT_SERVER_OUTPUT_FIELDS,
     DEFAULT_SKIP_DETAILED_REPORTS,
     DEFAULT_SKIP_SUMMARY_REPORTS,
@@ -797,6 +804,52 @@ def _add_run_search_configs(self):
                 description="Maximum number of steps take during the binary concurrency search.",
             )
         )
+        self._add_config(
+            ConfigField(
+                "run_config_search_saturation_window",
+                flags=["--run-config-search-saturation-window"],
+                field_type=ConfigPrimitive(int),
+                default_value=DEFAULT_RUN_CONFIG_SEARCH_SATURATION_WINDOW,
+                description="Number of consecutive concurrency/request rate measurements used to detect"
+                " that throughput has saturated while latency is still increasing. Values less than 2"
+                " disable the detection. Applies to the quick search sweep and the brute search's"
+                " sweep over its top results, and only if perf_latency_p99 is collected.",
+            )
+        )
+        self._add_config(
+            ConfigField(
+                "run_config_search_saturation_threshold",
+                flags=["--run-config-search-saturation-threshold"],
+                field_type=ConfigPrimitive(float),
+                default_value=DEFAULT_RUN_CONFIG_SEARCH_SATURATION_THRESHOLD,
+                description="The quick search sweep, and the brute search's sweep over its top results,"
+                " are terminated when the throughput gain across the saturation window is less than"
+                " (1 - threshold) of the best throughput measured, and latency is increasing.",
+            )
+        )
+        self._add_config(
+            ConfigField(
+                "run_config_search_deployment_target",
+                flags=["--run-config-search-deployment-target"],
+                choices=["gpu", "cpu"],
+                field_type=ConfigPrimitive(str),
+                default_value=DEFAULT_RUN_CONFIG_SEARCH_DEPLOYMENT_TARGET,
+                description="The device the model is deployed on. 'cpu' caps the concurrency"
+                " of the brute and quick searches at a lower max concurrency, unless"
+                " --run-config-search-max-concurrency is specified.",
+            )
+        )
+        self._add_config(
+            ConfigField(
+                "run_config_search_saturation_prior",
+                flags=["--run-config-search-saturation-prior"],
+                field_type=ConfigPrimitive(int),
+                default_value=DEFAULT_RUN_CONFIG_SEARCH_SATURATION_PRIOR,
+                description="The concurrency/request rate at which throughput saturated in a"
+                " previous run. If specified, the brute and quick searches will not go beyond four"
+                " times this value, unless the max concurrency/request rate is specified.",
+            )
+        )
         self._add_config(
             ConfigField(
                 "run_config_search_mode",
@@ -1513,3 +1566,53 @@ def is_request_rate_specified(self, model_parameters: dict) -> bool:
             or self.get_config()["run_config_search_min_request_rate"].is_set_by_user()
             or self.get_config()["run_config_search_max_request_rate"].is_set_by_user()
         )
+
+    def get_max_search_concurrency(self) -> int:
+        """
+        Returns the max concurrency of the automatic search, lowered
+        for a cpu deployment target and/or the saturation point from
+        a prior run, unless the user explicitly specified the max
+        """
+        target_max_concurrency = (
+            DEFAULT_RUN_CONFIG_CPU_MAX_CONCURRENCY
+            if self.run_config_search_deployment_target == "cpu"
+            else None
+        )
+
+        return self._get_limited_search_max(
+            "run_config_search_max_concurrency",
+            self.run_config_search_min_concurrency,
+            target_max_concurrency,
+        )
+
+    def get_max_search_request_rate(self) -> int:
+        """
+        Returns the max request rate of the automatic search, lowered
+        for the saturation point from a prior run, unless the user
+        explicitly specified the max
+        """
+        return self._get_limited_search_max(
+            "run_config_search_max_request_rate",
+            self.run_config_search_min_request_rate,
+        )
+
+    def _get_limited_search_max(
+        self,
+        max_field_name: str,
+        min_value: int,
+        target_max_value: Optional[int] = None,
+    ) -> int:
+        max_value = self._fields[max_field_name].value()
+
+        if self._fields[max_field_name].is_set_by_user():
+            return max_value
+
+        if target_max_value:
+            max_value = min(max_value, target_max_value)
+
+        if self.run_config_search_saturation_prior > 0:
+            max_value = min(
+                max_value, 2 ** int(log2(self.run_config_search_saturation_prior * 4))
+            )
+
+        return max(max_value, min_value)
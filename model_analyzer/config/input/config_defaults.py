@@ -51,6 +51,11 @@
 DEFAULT_RUN_CONFIG_MIN_MODEL_BATCH_SIZE = 1
 DEFAULT_RUN_CONFIG_MAX_MODEL_BATCH_SIZE = 128
 DEFAULT_RUN_CONFIG_MAX_BINARY_SEARCH_STEPS = 5
+DEFAULT_RUN_CONFIG_SEARCH_SATURATION_WINDOW = 3
+DEFAULT_RUN_CONFIG_SEARCH_SATURATION_THRESHOLD = 0.98
+DEFAULT_RUN_CONFIG_SEARCH_DEPLOYMENT_TARGET = "gpu"
+DEFAULT_RUN_CONFIG_SEARCH_SATURATION_PRIOR = 0
+DEFAULT_RUN_CONFIG_CPU_MAX_CONCURRENCY = 32
 DEFAULT_RUN_CONFIG_SEARCH_DISABLE = False
 DEFAULT_RUN_CONFIG_SEARCH_MODE = "brute"
 DEFAULT_RUN_CONFIG_PROFILE_MODELS_CONCURRENTLY_ENABLE = False
@@ -14,12 +14,45 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import lru_cache
+
 from model_analyzer.constants import CONFIG_PARSER_FAILURE, CONFIG_PARSER_SUCCESS
 
 from .config_status import ConfigStatus
 from .config_value import ConfigValue
 
 
+@lru_cache(maxsize=256)
+def _parse_range_str(range_str):
+    """
+    Parse a range string of the form <start:stop> or
+    <start:stop:step> into a (start, stop, step) tuple.
+    The same ranges recur across models, so results are cached.
+
+    Raises
+    ------
+    ValueError
+        If the range is malformed, start is greater than stop
+        or step is less than one
+    """
+
+    range_values = range_str.split(":", 2)
+    if len(range_values) < 2:
+        raise ValueError(f"range '{range_str}' should be of the form start:stop:step")
+
+    start = int(range_values[0])
+    stop = int(range_values[1])
+    step = int(range_values[2]) if len(range_values) == 3 else 1
+
+    if start > stop:
+        raise ValueError(f"start should be less than stop in range '{range_str}'")
+
+    if step < 1:
+        raise ValueError(f"step should be at least 1 in range '{range_str}'")
+
+    return start, stop, step
+
+
 class ConfigListNumeric(ConfigValue):
     """
     A list of numeric values.
@@ -57,7 +90,7 @@ def __init__(
         if validator is None:
 
             def validator(x):
-                if type(x) is list:
+                if isinstance(x, list):
                     return ConfigStatus(CONFIG_PARSER_SUCCESS)
 
                 return ConfigStatus(
@@ -74,15 +107,18 @@ def validator(x):
     def _process_list(self, value):
         """
         A function to process the case where value is
-        a list.
+        a list. Items can be ranges of the form <start:stop:step>
         """
 
         type_ = self._type
         new_value = []
 
         for item in value:
-            item = type_(item)
-            new_value.append(item)
+            if self._is_string(item) and ":" in item:
+                start, stop, step = _parse_range_str(item)
+                new_value.extend(type_(x) for x in range(start, stop + 1, step))
+            else:
+                new_value.append(type_(item))
 
         return new_value
 
@@ -98,17 +134,19 @@ def set_value(self, value):
         """
 
         type_ = self._type
+        name = self.name()
         new_value = []
 
         try:
-            if self._is_string(value):
-                self._value = []
-                value = value.split(",")
-
-            if self._is_list(value):
+            # Checked in order of how often each form is used
+            if isinstance(value, list):
                 new_value = self._process_list(value)
 
-            elif self._is_dict(value):
+            elif isinstance(value, str):
+                self._value = []
+                new_value = self._process_list(value.split(","))
+
+            elif isinstance(value, dict):
                 two_key_condition = (
                     len(value) == 2 and "start" in value and "stop" in value
                 )
@@ -125,7 +163,7 @@ def set_value(self, value):
                     if start > stop:
                         return ConfigStatus(
                             CONFIG_PARSER_FAILURE,
-                            f'When a dictionary is used for field "{self.name()}",'
+                            f'When a dictionary is used for field "{name}",'
                             ' "start" should be less than "stop".'
                             f" Current value is {value}.",
                             config_object=self,
@@ -137,7 +175,7 @@ def set_value(self, value):
                 else:
                     return ConfigStatus(
                         CONFIG_PARSER_FAILURE,
-                        f'If a dictionary is used for field "{self.name()}", it'
+                        f'If a dictionary is used for field "{name}", it'
                         ' should only contain "start" and "stop" key with an'
                         f' optional "step" key. Currently, contains {list(value)}.',
                         config_object=self,
@@ -145,7 +183,7 @@ def set_value(self, value):
             else:
                 new_value = [type_(value)]
         except ValueError as e:
-            message = f'Failed to set the value for field "{self.name()}". Error: {e}.'
+            message = f'Failed to set the value for field "{name}". Error: {e}.'
             return ConfigStatus(CONFIG_PARSER_FAILURE, message, self)
 
         return super().set_value(new_value)
@@ -34,6 +34,13 @@ class ModelRunConfig:
     DEFAULT_MAX_BATCH_SIZE = 1
     DEFAULT_PERF_BATCH_SIZE = 1
 
+    __slots__ = (
+        "_model_name",
+        "_model_config_variant",
+        "_perf_config",
+        "_composing_config_variants",
+    )
+
     def __init__(
         self,
         model_name: str,
@@ -276,6 +283,32 @@ def add_composing_model_config_variants(
         for composing_model_config_variant in composing_model_config_variants:
             self._composing_config_variants.append(composing_model_config_variant)
 
+    def copy_for_parameter_sweep(self) -> "ModelRunConfig":
+        """
+        Returns a copy of this ModelRunConfig that shares the model config
+        variants, but has its own PerfAnalyzerConfig that can be changed
+        """
+        model_run_config = ModelRunConfig(
+            self._model_name, self._model_config_variant, self._perf_config.copy()
+        )
+        model_run_config._composing_config_variants = list(
+            self._composing_config_variants
+        )
+
+        return model_run_config
+
+    def to_dict(self):
+        """
+        Returns
+        -------
+        dict
+            The attributes of this ModelRunConfig, keyed by name.
+            Used by AnalyzerStateManager.default_encode to write
+            the checkpoint, since __slots__ removes __dict__
+        """
+
+        return {key: getattr(self, key) for key in self.__slots__}
+
     @classmethod
     def from_dict(cls, model_run_config_dict):
         model_run_config = ModelRunConfig(None, None, None)
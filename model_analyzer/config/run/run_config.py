@@ -25,6 +25,8 @@ class RunConfig:
     at the same time in Perf Analyzer
     """
 
+    __slots__ = ("_triton_env", "_model_run_configs")
+
     def __init__(self, triton_env):
         """
         Parameters
@@ -125,6 +127,31 @@ def composing_configs(self):
         """
         return self._model_run_configs[0].composing_configs()
 
+    def copy_for_parameter_sweep(self) -> "RunConfig":
+        """
+        Returns a copy of this RunConfig where only the PerfAnalyzerConfigs
+        are copied, so that the sweep parameter (concurrency/request rate)
+        can be changed without a deepcopy of the model configs
+        """
+        run_config = RunConfig(self._triton_env)
+        for model_run_config in self._model_run_configs:
+            run_config.add_model_run_config(model_run_config.copy_for_parameter_sweep())
+
+        return run_config
+
+    def to_dict(self):
+        """
+        Returns
+        -------
+        dict
+            The attributes of this RunConfig, keyed by name.
+            __slots__ removes __dict__, so
+            AnalyzerStateManager.default_encode uses this
+            to serialize the RunConfig into the checkpoint
+        """
+
+        return {key: getattr(self, key) for key in self.__slots__}
+
     @classmethod
     def from_dict(cls, run_config_dict):
         run_config = RunConfig({})
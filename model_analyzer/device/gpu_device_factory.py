@@ -15,6 +15,7 @@
 # limitations under the License.
 
 import logging
+from functools import lru_cache
 
 import numba.cuda
 
@@ -27,6 +28,32 @@
 logger = logging.getLogger(LOGGER_NAME)
 
 
+@lru_cache(maxsize=1)
+def _get_cuda_devices():
+    """
+    Enumerates the CUDA visible devices. The devices do not
+    change over the lifetime of the process, so this is
+    only done once.
+
+    Returns
+    -------
+    tuple of (str, int, bytes)
+        The bus id, CUDA device id and name of each
+        CUDA visible device, in CUDA index order
+    """
+
+    cuda_devices = []
+    for cuda_device in numba.cuda.list_devices():
+        device_identity = cuda_device.get_device_identity()
+        pci_domain_id = device_identity["pci_domain_id"]
+        pci_device_id = device_identity["pci_device_id"]
+        pci_bus_id = device_identity["pci_bus_id"]
+        device_bus_id = f"{pci_domain_id:08X}:{pci_bus_id:02X}:{pci_device_id:02X}.0"
+        cuda_devices.append((device_bus_id, cuda_device.id, cuda_device.name))
+
+    return tuple(cuda_devices)
+
+
 class GPUDeviceFactory:
     """
     Factory class for creating GPUDevices
@@ -36,6 +63,9 @@ def __init__(self):
         self._devices = []
         self._devices_by_bus_id = {}
         self._devices_by_uuid = {}
+        self._cuda_bus_ids = []
+        self._cuda_visible_gpus = []
+        self._cuda_visible_uuids = set()
         self.init_all_devices()
 
     def init_all_devices(self, dcgmPath=None):
@@ -78,6 +108,33 @@ def init_all_devices(self, dcgmPath=None):
 
             dcgm_agent.dcgmShutdown()
 
+            self._init_cuda_visible_devices()
+
+    def _init_cuda_visible_devices(self):
+        """
+        Enumerate the CUDA visible devices once, caching the
+        bus id of each CUDA index and the DCGM supported
+        GPUDevices among them
+        """
+
+        self._cuda_bus_ids = []
+        self._cuda_visible_gpus = []
+        self._cuda_visible_uuids = set()
+
+        for device_bus_id, cuda_device_id, cuda_device_name in _get_cuda_devices():
+            self._cuda_bus_ids.append(device_bus_id)
+
+            try:
+                gpu_device = self.get_device_by_bus_id(device_bus_id)
+                self._cuda_visible_gpus.append(gpu_device)
+                self._cuda_visible_uuids.add(gpu_device.device_uuid())
+            except TritonModelAnalyzerException:
+                # Device not supported by DCGM, log warning
+                logger.warning(
+                    f"Device '{str(cuda_device_name, encoding='ascii')}' with "
+                    f"cuda device id {cuda_device_id} is not supported by DCGM."
+                )
+
     def get_device_by_bus_id(self, bus_id, dcgmPath=None):
         """
         Get a GPU device by using its bus ID.
@@ -124,18 +181,10 @@ def get_device_by_cuda_index(self, index):
             If the index is out of bound.
         """
 
-        devices = numba.cuda.list_devices()
-        if index > len(devices) - 1:
+        if index > len(self._cuda_bus_ids) - 1:
             raise IndexError
 
-        cuda_device = devices[index]
-        device_identity = cuda_device.get_device_identity()
-        pci_domain_id = device_identity["pci_domain_id"]
-        pci_device_id = device_identity["pci_device_id"]
-        pci_bus_id = device_identity["pci_bus_id"]
-        device_bus_id = f"{pci_domain_id:08X}:{pci_bus_id:02X}:{pci_device_id:02X}.0"
-
-        return self.get_device_by_bus_id(device_bus_id)
+        return self.get_device_by_bus_id(self._cuda_bus_ids[index])
 
     def get_device_by_uuid(self, uuid, dcgmPath=None):
         """
@@ -209,7 +258,13 @@ def verify_requested_gpus(self, requested_gpus):
             requested_gpus = [self.get_device_by_uuid(uuid) for uuid in requested_gpus]
 
         # Return the intersection of CUDA visible UUIDs and requested/supported UUIDs.
-        available_gpus = list(set(cuda_visible_gpus) & set(requested_gpus))
+        available_gpus = list(
+            {
+                gpu.device_uuid(): gpu
+                for gpu in requested_gpus
+                if gpu.device_uuid() in self._cuda_visible_uuids
+            }.values()
+        )
         self._log_gpus_used(available_gpus)
 
         return available_gpus
@@ -222,20 +277,7 @@ def get_cuda_visible_gpus(self):
             UUIDs of the DCGM supported devices visible to CUDA
         """
 
-        cuda_visible_gpus = []
-        if numba.cuda.is_available():
-            for cuda_device in numba.cuda.list_devices():
-                try:
-                    cuda_visible_gpus.append(
-                        self.get_device_by_cuda_index(cuda_device.id)
-                    )
-                except TritonModelAnalyzerException:
-                    # Device not supported by DCGM, log warning
-                    logger.warning(
-                        f"Device '{str(cuda_device.name, encoding='ascii')}' with "
-                        f"cuda device id {cuda_device.id} is not supported by DCGM."
-                    )
-        return cuda_visible_gpus
+        return list(self._cuda_visible_gpus)
 
     def _log_gpus_used(self, gpus):
         """
@@ -96,6 +96,15 @@ class PerfAnalyzerConfig:
         "collect-metrics",
     ]
 
+    __slots__ = (
+        "_args",
+        "_options",
+        "_verbose",
+        "_input_to_options",
+        "_input_to_verbose",
+        "_additive_args",
+    )
+
     def __init__(self):
         """
         Construct a PerfAnalyzerConfig
@@ -172,6 +181,30 @@ def update_config(self, params=None):
             for key in params:
                 self[key] = params[key]
 
+    def set_concurrency_range(self, concurrency):
+        """
+        Sets the concurrency-range argument directly,
+        bypassing the key lookups done by update_config
+
+        Parameters
+        ----------
+        concurrency: int
+        """
+
+        self._args["concurrency-range"] = concurrency
+
+    def set_request_rate_range(self, request_rate):
+        """
+        Sets the request-rate-range argument directly,
+        bypassing the key lookups done by update_config
+
+        Parameters
+        ----------
+        request_rate: int
+        """
+
+        self._args["request-rate-range"] = request_rate
+
     def update_config_from_profile_config(self, model_name, profile_config):
         """
         Set common values based on the input profile config
@@ -229,6 +262,35 @@ def update_config_from_profile_config(self, model_name, profile_config):
 
         self.update_config(params)
 
+    def copy(self):
+        """
+        Returns
+        -------
+        PerfAnalyzerConfig
+            A copy of this config whose arguments can be
+            changed without affecting this config
+        """
+
+        perf_config = PerfAnalyzerConfig()
+        perf_config._args = self._args.copy()
+        perf_config._options = self._options.copy()
+        perf_config._verbose = self._verbose.copy()
+        perf_config._additive_args = self._additive_args.copy()
+
+        return perf_config
+
+    def to_dict(self):
+        """
+        Returns
+        -------
+        dict
+            The attributes of this config, keyed by name.
+            Used by AnalyzerStateManager.default_encode to write
+            the checkpoint, since __slots__ removes __dict__
+        """
+
+        return {key: getattr(self, key) for key in self.__slots__}
+
     @classmethod
     def from_dict(cls, perf_config_dict):
         perf_config = PerfAnalyzerConfig()
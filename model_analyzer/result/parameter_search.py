@@ -15,8 +15,9 @@
 # limitations under the License.
 
 import logging
+from collections import deque
 from math import log2
-from typing import Generator, List, Optional
+from typing import Deque, Generator, List, Optional, Tuple
 
 from model_analyzer.config.input.config_command_profile import ConfigCommandProfile
 from model_analyzer.constants import (
@@ -35,6 +36,8 @@ class ParameterSearch:
     Generates the next parameter value to use when searching through
     RunConfigMeasurements for the best value (according to the users objective)
       - Will sweep from by powers of two from min to max parameter
+      - Will stop the sweep early if throughput has saturated while latency is
+        still increasing over the last few measurements
       - If the user specifies a constraint, the algorithm will perform a binary search
         around the boundary if the constraint is violated
 
@@ -61,27 +64,64 @@ def __init__(
         )
 
         if self._parameter_is_request_rate:
-            self._min_parameter_index = int(
-                log2(config.run_config_search_min_request_rate)
-            )
-            self._max_parameter_index = int(
-                log2(config.run_config_search_max_request_rate)
-            )
-
+            parameter_name = "request rate"
+            min_parameter = config.run_config_search_min_request_rate
+            max_parameter = config.get_max_search_request_rate()
+            configured_max_parameter = config.run_config_search_max_request_rate
         else:
-            self._min_parameter_index = int(
-                log2(config.run_config_search_min_concurrency)
-            )
-            self._max_parameter_index = int(
-                log2(config.run_config_search_max_concurrency)
+            parameter_name = "concurrency"
+            min_parameter = config.run_config_search_min_concurrency
+            max_parameter = config.get_max_search_concurrency()
+            configured_max_parameter = config.run_config_search_max_concurrency
+
+        self._min_parameter_index = int(log2(min_parameter))
+        self._max_parameter_index = int(log2(max_parameter))
+
+        if max_parameter != configured_max_parameter:
+            logger.info(
+                f"Limiting {parameter_name} sweep to "
+                f"{2**self._min_parameter_index}-{2**self._max_parameter_index}"
             )
 
+        self._planned_parameters = [
+            2**i
+            for i in range(self._min_parameter_index, self._max_parameter_index + 1)
+        ]
+
         self._max_binary_search_steps = config.run_config_search_max_binary_search_steps
+        self._saturation_window = config.run_config_search_saturation_window
+        self._saturation_threshold = config.run_config_search_saturation_threshold
+
+        self.reset()
 
+    def reset(self) -> None:
+        """
+        Clears the measurements and search state, so that
+        this object can be reused to search a new RunConfig
+        """
         self._run_config_measurements: List[Optional[RunConfigMeasurement]] = []
+        self._throughputs: List[Optional[float]] = []
+        self._latencies: List[Optional[float]] = []
+        self._passing: List[Optional[bool]] = []
+
+        # (index, RCM) of the best RCMs over the last
+        # THROUGHPUT_MINIMUM_CONSECUTIVE_PARAMETER_TRIES measurements,
+        # in decreasing order - the front is the best
+        self._best_rcms: Deque[Tuple[int, RunConfigMeasurement]] = deque()
         self._parameters: List[int] = []
         self._last_failing_parameter = 0
         self._last_passing_parameter = 0
+        self._parameter_sweep_finished = False
+
+    def remaining_steps(self) -> int:
+        """
+        Returns the number of planned parameter sweep values not
+        yet searched (this does not include binary search steps)
+        """
+        if self._parameter_sweep_finished:
+            return 0
+
+        return len(self._planned_parameters) - len(self._parameters)
 
     def add_run_config_measurement(
         self, run_config_measurement: Optional[RunConfigMeasurement]
@@ -91,6 +131,37 @@ def add_run_config_measurement(
         Invariant: Assumed that RCMs are added in the same order they are measured
         """
         self._run_config_measurements.append(run_config_measurement)
+        self._update_best_rcms(run_config_measurement)
+
+        if run_config_measurement:
+            self._throughputs.append(
+                run_config_measurement.get_non_gpu_metric_value("perf_throughput")
+            )
+            self._latencies.append(
+                run_config_measurement.get_non_gpu_metric_value("perf_latency_p99")
+            )
+            self._passing.append(run_config_measurement.is_passing_constraints())
+        else:
+            self._throughputs.append(None)
+            self._latencies.append(None)
+            self._passing.append(None)
+
+    def _update_best_rcms(
+        self, run_config_measurement: Optional[RunConfigMeasurement]
+    ) -> None:
+        index = len(self._run_config_measurements) - 1
+
+        if run_config_measurement:
+            while self._best_rcms and run_config_measurement > self._best_rcms[-1][1]:
+                self._best_rcms.pop()
+            self._best_rcms.append((index, run_config_measurement))
+
+        while (
+            self._best_rcms
+            and self._best_rcms[0][0]
+            <= index - THROUGHPUT_MINIMUM_CONSECUTIVE_PARAMETER_TRIES
+        ):
+            self._best_rcms.popleft()
 
     def search_parameters(self) -> Generator[int, None, None]:
         """
@@ -104,30 +175,33 @@ def search_parameters(self) -> Generator[int, None, None]:
             yield from self._perform_binary_parameter_search()
 
     def _perform_parameter_sweep(self) -> Generator[int, None, None]:
-        for parameter in (
-            2**i
-            for i in range(self._min_parameter_index, self._max_parameter_index + 1)
-        ):
-            if self._should_continue_parameter_sweep():
+        for parameter in self._planned_parameters:
+            self._check_measurement_count()
+
+            throughput_saturated = self._has_throughput_saturated()
+            if not throughput_saturated and self._should_continue_parameter_sweep():
                 self._parameters.append(parameter)
                 yield parameter
             else:
                 # We can't actually skip the sweep because the results need to be added
                 # but, we can suppress the logging messages
                 if not self._skip_parameter_sweep:
-                    if self._parameter_is_request_rate:
-                        logger.info(
-                            "Terminating request rate sweep - throughput is decreasing"
-                        )
-                    else:
-                        logger.info(
-                            "Terminating concurrency sweep - throughput is decreasing"
-                        )
-                    return
+                    parameter_name = (
+                        "request rate"
+                        if self._parameter_is_request_rate
+                        else "concurrency"
+                    )
+                    reason = (
+                        "throughput has saturated"
+                        if throughput_saturated
+                        else "throughput is decreasing"
+                    )
+                    logger.info(f"Terminating {parameter_name} sweep - {reason}")
+                    break
+
+        self._parameter_sweep_finished = True
 
     def _should_continue_parameter_sweep(self) -> bool:
-        self._check_measurement_count()
-
         if not self._are_minimum_tries_reached():
             return True
         else:
@@ -149,6 +223,55 @@ def _are_minimum_tries_reached(self) -> bool:
         else:
             return True
 
+    def _has_throughput_saturated(self) -> bool:
+        """
+        Returns true if, over the saturation window, the throughput
+        gain is negligible compared to the best throughput seen so far,
+        while the latency is still increasing
+        """
+        if (
+            self._saturation_window < 2
+            or len(self._throughputs) < self._saturation_window
+        ):
+            return False
+
+        parameters = self._parameters[-self._saturation_window :]
+        window_throughputs = self._throughputs[-self._saturation_window :]
+        window_latencies = self._latencies[-self._saturation_window :]
+
+        # Only decide on a window where every measurement has a result from PA
+        if None in window_throughputs or None in window_latencies:
+            return False
+
+        throughputs = [
+            throughput for throughput in window_throughputs if throughput is not None
+        ]
+        latencies = [latency for latency in window_latencies if latency is not None]
+
+        max_throughput = max(
+            throughput for throughput in self._throughputs if throughput is not None
+        )
+        throughput_gain = self._calculate_slope(parameters, throughputs) * (
+            parameters[-1] - parameters[0]
+        )
+
+        return (
+            throughput_gain <= (1 - self._saturation_threshold) * max_throughput
+            and self._calculate_slope(parameters, latencies) > 0
+        )
+
+    def _calculate_slope(self, xs: List[int], ys: List[float]) -> float:
+        """
+        Returns the slope of the least squares line through the points
+        """
+        x_mean = sum(xs) / len(xs)
+        y_mean = sum(ys) / len(ys)
+
+        numerator = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
+        denominator = sum((x - x_mean) ** 2 for x in xs)
+
+        return numerator / denominator if denominator else 0
+
     def _has_objective_gain_saturated(self) -> bool:
         gain = self._calculate_gain()
         return gain < THROUGHPUT_MINIMUM_GAIN
@@ -173,52 +296,26 @@ def _calculate_gain(self) -> float:
         return gain
 
     def _get_best_rcm(self) -> Optional[RunConfigMeasurement]:
-        # Need to remove entries (None) with no result from PA before sorting
-        pruned_rcms = [
-            rcm
-            for rcm in self._run_config_measurements[
-                -THROUGHPUT_MINIMUM_CONSECUTIVE_PARAMETER_TRIES:
-            ]
-            if rcm
-        ]
-        best_rcm = max(pruned_rcms) if pruned_rcms else None
-
-        return best_rcm
+        # Entries (None) with no result from PA are never added to the best RCMs
+        return self._best_rcms[0][1] if self._best_rcms else None
 
     def _was_constraint_violated(self) -> bool:
-        for i in range(len(self._run_config_measurements) - 1, 1, -1):
+        for i in range(len(self._run_config_measurements) - 1, 0, -1):
             if self._at_constraint_failure_boundary(i):
                 self._last_failing_parameter = self._parameters[i]
                 self._last_passing_parameter = self._parameters[i - 1]
                 return True
 
-        if (
-            self._run_config_measurements[0]
-            and not self._run_config_measurements[0].is_passing_constraints()
-        ):
-            self._last_failing_parameter = self._parameters[i]
+        if self._passing[0] is False:
+            self._last_failing_parameter = self._parameters[0]
             self._last_passing_parameter = 0
             return True
         else:
             return False
 
     def _at_constraint_failure_boundary(self, index: int) -> bool:
-        if (
-            not self._run_config_measurements[index]
-            or not self._run_config_measurements[index - 1]
-        ):
-            return False
-
-        at_failure_boundary = (
-            not self._run_config_measurements[  # type: ignore
-                index
-            ].is_passing_constraints()
-            and self._run_config_measurements[
-                index - 1  # type: ignore
-            ].is_passing_constraints()
-        )
-
-        return at_failure_boundary
+        # Measurements without a result from PA (None) are never at the boundary
+        return self._passing[index] is False and self._passing[index - 1] is True
 
     def _perform_binary_parameter_search(self) -> Generator[int, None, None]:
         # This is needed because we are going to restart the search from the
@@ -228,15 +325,26 @@ def _perform_binary_parameter_search(self) -> Generator[int, None, None]:
         for i in range(0, self._max_binary_search_steps):
             parameter = self._determine_next_binary_parameter()
 
-            if parameter != self._parameters[-1]:
-                self._parameters.append(parameter)
-                yield parameter
+            # There is nothing left to search below a parameter of 1
+            if parameter == 0:
+                return
+
+            # Once the boundary is found, or the parameter repeats, every
+            # remaining step would either be skipped or re-measure an endpoint
+            if (
+                self._last_failing_parameter - self._last_passing_parameter <= 1
+                or parameter == self._parameters[-1]
+            ):
+                return
+
+            self._parameters.append(parameter)
+            yield parameter
 
     def _determine_next_binary_parameter(self) -> int:
-        if not self._run_config_measurements[-1]:
+        if self._passing[-1] is None:
             return 0
 
-        if self._run_config_measurements[-1].is_passing_constraints():
+        if self._passing[-1]:
             self._last_passing_parameter = self._parameters[-1]
             parameter = int((self._last_failing_parameter + self._parameters[-1]) / 2)
         else:
@@ -14,9 +14,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import heapq
 import logging
 from copy import deepcopy
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from model_analyzer.constants import LOGGER_NAME
 from model_analyzer.result.run_config_result import RunConfigResult
@@ -35,6 +36,11 @@ class SortedResults:
     def __init__(self) -> None:
         self._run_config_results: List[RunConfigResult] = []
 
+        # Sorted (passing, failing) lists, cleared whenever a result is added
+        self._passing_and_failing_lists: Optional[
+            Tuple[List[RunConfigResult], List[RunConfigResult]]
+        ] = None
+
     def results(self) -> List[RunConfigResult]:
         """
         Returns
@@ -57,6 +63,8 @@ def add_result(self, run_config_result: RunConfigResult) -> None:
             The result to be added
         """
 
+        self._passing_and_failing_lists = None
+
         existing_run_config_result = self._find_existing_run_config_result(
             run_config_result
         )
@@ -82,7 +90,13 @@ def top_n_results(self, n: int) -> List[RunConfigResult]:
             The n best results for this model,
             must all be passing results
         """
-        passing_results, failing_results = self._create_passing_and_failing_lists()
+        if self._passing_and_failing_lists or n == SortedResults.GET_ALL_RESULTS:
+            passing_results, failing_results = self._create_passing_and_failing_lists()
+        else:
+            # Only the top n are needed, so avoid sorting all of the results
+            passing_results, failing_results = self._split_passing_and_failing(
+                self._run_config_results
+            )
 
         if len(passing_results) == 0:
             logger.warning(
@@ -123,11 +137,22 @@ def _add_new_run_config_result(self, run_config_result: RunConfigResult) -> None
         self._run_config_results.append(new_run_config_result)
 
     def _create_passing_and_failing_lists(self):
+        if self._passing_and_failing_lists:
+            return self._passing_and_failing_lists
+
         self._run_config_results.sort()
 
+        self._passing_and_failing_lists = self._split_passing_and_failing(
+            self._run_config_results
+        )
+        return self._passing_and_failing_lists
+
+    def _split_passing_and_failing(
+        self, run_config_results: List[RunConfigResult]
+    ) -> Tuple[List[RunConfigResult], List[RunConfigResult]]:
         passing = []
         failing = []
-        for rcr in self._run_config_results:
+        for rcr in run_config_results:
             if rcr.failing():
                 failing.append(rcr)
             else:
@@ -139,7 +164,7 @@ def _get_top_n_results(
         self, results: List[RunConfigResult], n: int
     ) -> List[RunConfigResult]:
         if n == SortedResults.GET_ALL_RESULTS:
-            return results
+            return results[:]
         if n > len(results):
             logger.warning(
                 f"Requested top {n} configs, "
@@ -147,5 +172,5 @@ def _get_top_n_results(
                 "Showing all available configs for this model."
             )
 
-        result_len = min(n, len(results))
-        return results[0:result_len]
+        # Better results compare as less than, so the best are the smallest
+        return heapq.nsmallest(n, results)
@@ -302,6 +302,44 @@ def construct_perf_analyzer_config(
     return pa_config
 
 
+def construct_perf_analyzer_config_dicts(
+    model_name="my-model",
+    output_file_name="my-model-results.csv",
+    batch_size=DEFAULT_BATCH_SIZES,
+    concurrency=1,
+    request_rate=None,
+    launch_mode=DEFAULT_TRITON_LAUNCH_MODE,
+    client_protocol=DEFAULT_CLIENT_PROTOCOL,
+    perf_analyzer_flags=None,
+):
+    """
+    Constructs the options, args and additive args of a
+    Perf Analyzer Config, which is all that is needed to compare
+    against generated configs
+
+    Takes the same parameters as construct_perf_analyzer_config
+
+    Returns
+    -------
+    tuple of (dict, dict, dict)
+        The options, args and additive args of the
+        Perf Analyzer Config
+    """
+
+    pa_config = construct_perf_analyzer_config(
+        model_name,
+        output_file_name,
+        batch_size,
+        concurrency,
+        request_rate,
+        launch_mode,
+        client_protocol,
+        perf_analyzer_flags,
+    )
+
+    return pa_config._options, pa_config._args, pa_config._additive_args
+
+
 def construct_run_config(
     model_name: str, model_config_variant_name: str, pa_config_name: str
 ) -> RunConfig:
@@ -388,6 +426,44 @@ def construct_run_config_measurement(
     return rc_measurement
 
 
+class _FastMeasurement:
+    """
+    Stand-in for a RunConfigMeasurement that only
+    carries a perf_throughput value
+    """
+
+    __slots__ = ("_throughput",)
+
+    def __init__(self, perf_throughput):
+        self._throughput = perf_throughput
+
+    def get_non_gpu_metric_value(self, tag):
+        return self._throughput if tag == "perf_throughput" else 0
+
+    def __lt__(self, other):
+        return self._throughput < other._throughput
+
+
+def make_fast_measurement(perf_throughput):
+    """
+    Constructs a lightweight measurement for code that only reads
+    perf_throughput and compares measurements (such as the
+    PerfAnalyzerConfigGenerator)
+
+    Parameters
+    ----------
+    perf_throughput: float
+        The throughput of the measurement
+
+    Returns
+    -------
+    _FastMeasurement
+        exposing get_non_gpu_metric_value() and ordered by throughput
+    """
+
+    return _FastMeasurement(perf_throughput)
+
+
 def construct_run_config_result(
     avg_gpu_metric_values,
     avg_non_gpu_metric_values_list,
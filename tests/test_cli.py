@@ -84,7 +84,10 @@ def get_test_options():
         OptionStruct("int", "profile", "--run-config-search-min-instance-count", None, "2", "1"),
         OptionStruct("int", "profile", "--run-config-search-max-instance-count", None, "10", "5"),
         OptionStruct("int", "profile", "--run-config-search-max-binary-search-steps", None, "10", "5"),
+        OptionStruct("int", "profile", "--run-config-search-saturation-window", None, "5", "3"),
+        OptionStruct("int", "profile", "--run-config-search-saturation-prior", None, "16", "0"),
         OptionStruct("float", "profile", "--monitoring-interval", "-i", "10.0", "1.0"),
+        OptionStruct("float", "profile", "--run-config-search-saturation-threshold", None, "0.9", "0.98"),
         OptionStruct("float", "profile", "--perf-analyzer-cpu-util", None, "10.0", str(psutil.cpu_count() * 80.0)),
         OptionStruct("int", "profile", "--num-configs-per-model", None, "10", "3"),
         OptionStruct("int", "profile", "--num-top-model-configs", None, "10", "0"),
@@ -112,6 +115,7 @@ def get_test_options():
         OptionStruct("string", "profile", "--triton-server-path", None, "test_path", "tritonserver", None),
         OptionStruct("string", "profile", "--triton-output-path", None, "test_path", None, None),
         OptionStruct("string", "profile", "--triton-launch-mode", None, ["local", "docker", "remote","c_api"], "local", "SHOULD_FAIL"),
+        OptionStruct("string", "profile", "--run-config-search-deployment-target", None, ["gpu", "cpu"], "gpu", "SHOULD_FAIL"),
         OptionStruct("string", "profile", "--triton-install-path", None, "test_path", "/opt/tritonserver", None),
         OptionStruct("string", "profile", "--checkpoint-directory", "-s", "./test_dir", os.path.join(os.getcwd(), "checkpoints"), None),
         OptionStruct("string", "profile", "--export-path", "-e", "./test_dir", os.getcwd(), None),
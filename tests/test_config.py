@@ -411,6 +411,15 @@ def test_range_and_list_values(self):
             config.get_config()["batch_sizes"].field_type(), ConfigListNumeric
         )
 
+        yaml_content = """
+concurrency: 1,4:8:2,10:11
+"""
+        config = self._evaluate_config(args, yaml_content)
+        self.assertEqual(config.get_all_config()["concurrency"], [1, 4, 6, 8, 10, 11])
+        self.assertIsInstance(
+            config.get_config()["concurrency"].field_type(), ConfigListNumeric
+        )
+
     def test_object(self):
         args = [
             "model-analyzer",
@@ -1102,6 +1111,24 @@ def test_error_messages(self):
         print(config_status.message())
         self.assertEqual(config_status.status(), CONFIG_PARSER_FAILURE)
 
+        config_numeric = ConfigListNumeric(int)
+        config_numeric.set_name("key")
+        config_status = config_numeric.set_value("10:2")
+        print(config_status.message())
+        self.assertEqual(config_status.status(), CONFIG_PARSER_FAILURE)
+
+        config_numeric = ConfigListNumeric(int)
+        config_numeric.set_name("key")
+        config_status = config_numeric.set_value("1:10:-1")
+        print(config_status.message())
+        self.assertEqual(config_status.status(), CONFIG_PARSER_FAILURE)
+
+        config_numeric = ConfigListNumeric(int)
+        config_numeric.set_name("key")
+        config_status = config_numeric.set_value("1:10:0")
+        print(config_status.message())
+        self.assertEqual(config_status.status(), CONFIG_PARSER_FAILURE)
+
         # ConfigUnion error message
         config_union = ConfigUnion([ConfigListNumeric(float), ConfigPrimitive(str)])
         config_union.set_name("key")
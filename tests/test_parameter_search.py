@@ -145,6 +145,131 @@ def test_saturating_sweep(self):
         ]
         self.assertEqual(self._concurrencies, expected_concurrencies)
 
+    def test_saturating_sweep_with_increasing_latency(self):
+        """
+        Test sweeping concurrency from min to max, when no constraints are present
+        and throughput saturates while latency keeps increasing - which ends the sweep
+        once a full saturation window is flat
+        """
+        config = self._create_single_model_no_constraints()
+        constraint_manager = ConstraintManager(config)
+        concurrency_search = ParameterSearch(config)
+        INCREASE_THROUGHPUT_COUNT = 4
+
+        # [100, 200, 400, 800, 800, 800,...]
+        throughputs = [
+            100 * 2**c if c < INCREASE_THROUGHPUT_COUNT else 800
+            for c in range(self._min_concurrency_index, self._max_concurrency_index + 1)
+        ]
+
+        for i, concurrency in enumerate(concurrency_search.search_parameters()):
+            self._concurrencies.append(concurrency)
+
+            concurrency_search.add_run_config_measurement(
+                run_config_measurement=self._construct_rcm(
+                    throughput=throughputs[i],
+                    latency=10 * concurrency,
+                    concurrency=concurrency,
+                    constraint_manager=constraint_manager,
+                )
+            )
+
+        expected_concurrencies = [
+            2**c
+            for c in range(
+                INCREASE_THROUGHPUT_COUNT
+                + config.run_config_search_saturation_window
+                - 1
+            )
+        ]
+        self.assertEqual(self._concurrencies, expected_concurrencies)
+
+    def test_remaining_steps(self):
+        """
+        Test that remaining steps counts down the planned sweep, and is
+        zero once the sweep terminates early
+        """
+        config = self._create_single_model_no_constraints()
+        constraint_manager = ConstraintManager(config)
+        concurrency_search = ParameterSearch(config)
+
+        self.assertEqual(
+            concurrency_search.remaining_steps(), len(self._expected_concurrencies)
+        )
+
+        for i, concurrency in enumerate(concurrency_search.search_parameters()):
+            self.assertEqual(
+                concurrency_search.remaining_steps(),
+                len(self._expected_concurrencies) - i - 1,
+            )
+
+            concurrency_search.add_run_config_measurement(
+                run_config_measurement=self._construct_rcm(
+                    throughput=100,
+                    latency=10,
+                    concurrency=concurrency,
+                    constraint_manager=constraint_manager,
+                )
+            )
+
+        self.assertEqual(concurrency_search.remaining_steps(), 0)
+
+    def test_clamped_sweep(self):
+        """
+        Test that the concurrency sweep max is lowered for a cpu deployment
+        target or a saturation prior, but not if the user specified the max
+        """
+        args = ["model-analyzer", "profile", "--profile-models", "test_model"]
+        tests = [
+            (["--run-config-search-deployment-target", "cpu"], 32),
+            (["--run-config-search-saturation-prior", "16"], 64),
+            (
+                [
+                    "--run-config-search-deployment-target",
+                    "cpu",
+                    "--run-config-search-saturation-prior",
+                    "4",
+                ],
+                16,
+            ),
+            (
+                [
+                    "--run-config-search-deployment-target",
+                    "cpu",
+                    "--run-config-search-max-concurrency",
+                    "128",
+                ],
+                128,
+            ),
+        ]
+
+        for extra_args, expected_max_concurrency in tests:
+            config = evaluate_mock_config(args + extra_args, "")
+            constraint_manager = ConstraintManager(config)
+            concurrency_search = ParameterSearch(config)
+            concurrencies = []
+
+            for concurrency in concurrency_search.search_parameters():
+                concurrencies.append(concurrency)
+
+                concurrency_search.add_run_config_measurement(
+                    run_config_measurement=self._construct_rcm(
+                        throughput=100 * concurrency,
+                        latency=10,
+                        concurrency=concurrency,
+                        constraint_manager=constraint_manager,
+                    )
+                )
+
+            expected_concurrencies = [
+                2**c
+                for c in range(
+                    self._min_concurrency_index,
+                    int(log2(expected_max_concurrency)) + 1,
+                )
+            ]
+            self.assertEqual(concurrencies, expected_concurrencies)
+
     def test_sweep_with_constraints_decreasing(self):
         """
         Test sweeping concurrency from min to max, with 95ms latency constraint
@@ -171,6 +296,34 @@ def test_sweep_with_constraints_decreasing(self):
 
         self.assertEqual(self._concurrencies, self._expected_concurrencies)
 
+    def test_sweep_with_constraints_converging(self):
+        """
+        Test sweeping concurrency from min to max, with 85ms latency constraint
+        and throughput is linearly increasing - which causes a decreasing binary search
+        that ends once the boundary (8 passing, 9 failing) is found, without
+        re-measuring concurrency 8
+        """
+        config = self._create_single_model_with_constraints("85")
+        constraint_manager = ConstraintManager(config)
+        concurrency_search = ParameterSearch(config)
+
+        self._expected_concurrencies.extend([12, 10, 9])
+        latencies = [10 * c for c in self._expected_concurrencies]
+
+        for i, concurrency in enumerate(concurrency_search.search_parameters()):
+            self._concurrencies.append(concurrency)
+
+            concurrency_search.add_run_config_measurement(
+                run_config_measurement=self._construct_rcm(
+                    throughput=100 * concurrency,
+                    latency=latencies[i],
+                    concurrency=concurrency,
+                    constraint_manager=constraint_manager,
+                )
+            )
+
+        self.assertEqual(self._concurrencies, self._expected_concurrencies)
+
     def test_sweep_with_constraints_decrease_then_increase(self):
         """
         Test sweeping concurrency from min to max, with 155ms latency constraint
@@ -252,6 +405,91 @@ def test_sweep_with_constraints_hitting_limit(self):
 
         self.assertEqual(self._concurrencies, self._expected_concurrencies)
 
+    def test_sweep_with_constraints_failing_from_start(self):
+        """
+        Test sweeping request rate from min to max, with 95ms latency constraint
+        that every measurement violates - which causes a binary search below the
+        minimum request rate, stopping before a request rate of 0
+        """
+        config = self._create_single_model_with_constraints("95")
+        constraint_manager = ConstraintManager(config)
+        concurrency_search = ParameterSearch(
+            config, model_parameters={"request_rate": "True"}
+        )
+
+        self._expected_request_rates.extend([8, 4, 2, 1])
+
+        for request_rate in concurrency_search.search_parameters():
+            self._request_rates.append(request_rate)
+
+            concurrency_search.add_run_config_measurement(
+                run_config_measurement=self._construct_rcm(
+                    throughput=100 * request_rate,
+                    latency=100,
+                    request_rate=request_rate,
+                    constraint_manager=constraint_manager,
+                )
+            )
+
+        self.assertEqual(self._request_rates, self._expected_request_rates)
+
+    def test_sweep_with_constraints_failing_after_first(self):
+        """
+        Test sweeping request rate from min to max, with 95ms latency constraint
+        that only the first measurement passes - which causes a binary search
+        between the first two request rates
+        """
+        config = self._create_single_model_with_constraints("95")
+        constraint_manager = ConstraintManager(config)
+        concurrency_search = ParameterSearch(
+            config, model_parameters={"request_rate": "True"}
+        )
+
+        self._expected_request_rates.extend([24, 20, 18, 19])
+
+        for request_rate in concurrency_search.search_parameters():
+            self._request_rates.append(request_rate)
+
+            concurrency_search.add_run_config_measurement(
+                run_config_measurement=self._construct_rcm(
+                    throughput=100 * request_rate,
+                    latency=5 * request_rate,
+                    request_rate=request_rate,
+                    constraint_manager=constraint_manager,
+                )
+            )
+
+        self.assertEqual(self._request_rates, self._expected_request_rates)
+
+    def test_reset(self):
+        """
+        Test that after a reset the same search is repeated
+        """
+        config = self._create_single_model_with_constraints("155")
+        constraint_manager = ConstraintManager(config)
+        concurrency_search = ParameterSearch(config)
+
+        self._expected_concurrencies.extend([12, 14, 15])
+        latencies = [10 * c for c in self._expected_concurrencies]
+
+        for _ in range(2):
+            concurrency_search.reset()
+            self._concurrencies = []
+
+            for i, concurrency in enumerate(concurrency_search.search_parameters()):
+                self._concurrencies.append(concurrency)
+
+                concurrency_search.add_run_config_measurement(
+                    run_config_measurement=self._construct_rcm(
+                        throughput=100 * concurrency,
+                        latency=latencies[i],
+                        concurrency=concurrency,
+                        constraint_manager=constraint_manager,
+                    )
+                )
+
+            self.assertEqual(self._concurrencies, self._expected_concurrencies)
+
     def test_not_adding_measurements(self):
         """
         Test that an exception is raised if measurements are not added
@@ -130,6 +130,13 @@ def test_perf_analyzer_config(self):
         self.config["extra-verbose"] = True
         self.assertTrue(self.config["extra-verbose"])
 
+        # set sweep parameters directly
+        self.config.set_concurrency_range(16)
+        self.assertEqual(self.config["concurrency-range"], 16)
+
+        self.config.set_request_rate_range(32)
+        self.assertEqual(self.config["request-rate-range"], 32)
+
     def test_perf_analyzer_boolean_args(self):
         """Test that only positive boolean args get added"""
         expected_cli_str = "-m test_model --measurement-interval=1000 --binary-search --measurement-request-count=50"
@@ -15,26 +15,45 @@
 # limitations under the License.
 
 import unittest
-from unittest.mock import MagicMock, patch
+from functools import lru_cache
+from itertools import zip_longest
+from unittest.mock import MagicMock
 
 from model_analyzer.config.generate.generator_utils import GeneratorUtils as utils
 from model_analyzer.config.generate.perf_analyzer_config_generator import (
     PerfAnalyzerConfigGenerator,
 )
 from model_analyzer.config.input.config_defaults import (
+    DEFAULT_RUN_CONFIG_CPU_MAX_CONCURRENCY,
     DEFAULT_RUN_CONFIG_MAX_CONCURRENCY,
     DEFAULT_RUN_CONFIG_MAX_REQUEST_RATE,
     DEFAULT_RUN_CONFIG_MIN_REQUEST_RATE,
 )
 from tests.common.test_utils import (
-    construct_perf_analyzer_config,
+    construct_perf_analyzer_config_dicts,
     construct_run_config_measurement,
     evaluate_mock_config,
+    make_fast_measurement,
 )
 
 from .common import test_result_collector as trc
 from .mocks.mock_os import MockOSMethods
 
+# Placeholder for arguments whose value is never inspected
+_UNUSED = object()
+
+_BASE_YAML = """
+profile_models:
+    - my-model
+"""
+
+
+@lru_cache(maxsize=64)
+def _evaluate_mock_config(args, yaml_str):
+    # PerfAnalyzerConfigGenerator only reads the config, so the parsed
+    # config can safely be shared between tests
+    return evaluate_mock_config(list(args), yaml_str, subcommand="profile")
+
 
 class TestPerfAnalyzerConfigGenerator(trc.TestResultCollector):
     def __init__(self, methodname):
@@ -67,31 +86,105 @@ def test_set_last_results(self):
         pacg.set_last_results([measurement1, measurement2, measurement3])
         self.assertEqual(pacg._last_results[0], measurement2)
 
-    def test_default(self):
+    def test_default_concurrencies(self):
         """
-        Test Default:
+        Test the auto-search over the default concurrencies:
             - No CLI options specified
+            - Launch mode is C_API
+            - Client protocol is HTTP
+            - Schmoo batch sizes (1,2,4)
+            - Percentile (PA flag) set in model's YAML
+            - SSL options (PA flags) set in model's YAML
 
-        Default (1) value will be used for batch size
-        and log2(DEFAULT_RUN_CONFIG_MAX_CONCURRENCY)+1 configs
-        will be generated by the auto-search
+        log2(DEFAULT_RUN_CONFIG_MAX_CONCURRENCY)+1 configs will be
+        generated by the auto-search for each batch size
         """
 
         # yapf: disable
-        yaml_str = ("""
+        pa_flags_yaml_str = ("""
             profile_models:
-                - my-model
+                - my-model:
+                    perf_analyzer_flags:
+                        percentile: 96
+            """)
+
+        ssl_yaml_str = ("""
+            profile_models:
+                - my-model:
+                    perf_analyzer_flags:
+                        ssl-grpc-root-certifications-file: a
+                        ssl-grpc-private-key-file: b
+                        ssl-grpc-certificate-chain-file: c
+                        ssl-https-verify-peer: 1
+                        ssl-https-verify-host: 2
+                        ssl-https-ca-certificates-file: d
+                        ssl-https-client-certificate-type: e
+                        ssl-https-client-certificate-file: f
+                        ssl-https-private-key-type: g
+                        ssl-https-private-key-file: h
             """)
         # yapf: enable
 
-        concurrencies = utils.generate_doubled_list(
-            1, DEFAULT_RUN_CONFIG_MAX_CONCURRENCY
-        )
-        expected_configs = [
-            construct_perf_analyzer_config(concurrency=c) for c in concurrencies
+        ssl_flags = {
+            "ssl-grpc-root-certifications-file": "a",
+            "ssl-grpc-private-key-file": "b",
+            "ssl-grpc-certificate-chain-file": "c",
+            "ssl-https-verify-peer": "1",
+            "ssl-https-verify-host": "2",
+            "ssl-https-ca-certificates-file": "d",
+            "ssl-https-client-certificate-type": "e",
+            "ssl-https-client-certificate-file": "f",
+            "ssl-https-private-key-type": "g",
+            "ssl-https-private-key-file": "h",
+        }
+
+        # (name, yaml_str, pa_cli_args, batch_sizes, expected config kwargs)
+        variants = [
+            ("default", _BASE_YAML, [], [1], {}),
+            (
+                "c_api",
+                _BASE_YAML,
+                ["--triton-launch-mode=c_api"],
+                [1],
+                {"launch_mode": "c_api"},
+            ),
+            (
+                "http",
+                _BASE_YAML,
+                ["--client-protocol=http"],
+                [1],
+                {"client_protocol": "http"},
+            ),
+            ("batch_size_search_enabled", _BASE_YAML, ["-b 1,2,4"], [1, 2, 4], {}),
+            (
+                "perf_analyzer_flags",
+                pa_flags_yaml_str,
+                [],
+                [1],
+                {"perf_analyzer_flags": {"percentile": "96"}},
+            ),
+            (
+                "ssl_options",
+                ssl_yaml_str,
+                [],
+                [1],
+                {"perf_analyzer_flags": ssl_flags},
+            ),
         ]
 
-        self._run_and_test_perf_analyzer_config_generator(yaml_str, expected_configs)
+        for name, yaml_str, pa_cli_args, batch_sizes, kwargs in variants:
+            with self.subTest(name=name):
+                expected_configs = [
+                    construct_perf_analyzer_config_dicts(
+                        batch_size=b, concurrency=c, **kwargs
+                    )
+                    for b in batch_sizes
+                    for c in self._DEFAULT_CONCURRENCIES
+                ]
+
+                self._run_and_test_perf_analyzer_config_generator(
+                    yaml_str, expected_configs, pa_cli_args
+                )
 
     def test_search_disabled(self):
         """
@@ -102,73 +195,12 @@ def test_search_disabled(self):
         and concurrency will be set to 1
         """
 
-        # yapf: disable
-        yaml_str = ("""
-            profile_models:
-                - my-model
-            """)
-        # yapf: enable
+        yaml_str = _BASE_YAML
 
-        expected_configs = [construct_perf_analyzer_config()]
+        expected_configs = [construct_perf_analyzer_config_dicts()]
 
         self._run_and_test_perf_analyzer_config_generator(
-            yaml_str, expected_configs, "--run-config-search-disable"
-        )
-
-    def test_c_api(self):
-        """
-        Test C_API:
-            - Launch mode is C_API
-
-        Default (1) values will be used for batch size/concurrency
-        and only one config will be generated
-        """
-
-        # yapf: disable
-        yaml_str = ("""
-            profile_models:
-                - my-model
-            """)
-        # yapf: enable
-
-        concurrencies = utils.generate_doubled_list(
-            1, DEFAULT_RUN_CONFIG_MAX_CONCURRENCY
-        )
-        expected_configs = [
-            construct_perf_analyzer_config(concurrency=c, launch_mode="c_api")
-            for c in concurrencies
-        ]
-
-        self._run_and_test_perf_analyzer_config_generator(
-            yaml_str, expected_configs, "--triton-launch-mode=c_api"
-        )
-
-    def test_http(self):
-        """
-        Test HTTP:
-            - Client protocol is HTTP
-
-        Default (1) values will be used for batch size/concurrency
-        and only one config will be generated
-        """
-
-        # yapf: disable
-        yaml_str = ("""
-            profile_models:
-                - my-model
-            """)
-        # yapf: enable
-
-        concurrencies = utils.generate_doubled_list(
-            1, DEFAULT_RUN_CONFIG_MAX_CONCURRENCY
-        )
-        expected_configs = [
-            construct_perf_analyzer_config(concurrency=c, client_protocol="http")
-            for c in concurrencies
-        ]
-
-        self._run_and_test_perf_analyzer_config_generator(
-            yaml_str, expected_configs, "--client-protocol=http"
+            yaml_str, expected_configs, ["--run-config-search-disable"]
         )
 
     def test_batch_size_search_disabled(self):
@@ -182,16 +214,11 @@ def test_batch_size_search_disabled(self):
         and 3 configs will be generated
         """
 
-        # yapf: disable
-        yaml_str = ("""
-            profile_models:
-                - my-model
-            """)
-        # yapf: enable
+        yaml_str = _BASE_YAML
 
         batch_sizes = [1, 2, 4]
         expected_configs = [
-            construct_perf_analyzer_config(batch_size=b) for b in batch_sizes
+            construct_perf_analyzer_config_dicts(batch_size=b) for b in batch_sizes
         ]
 
         pa_cli_args = ["-b 1,2,4", "--run-config-search-disable"]
@@ -199,38 +226,6 @@ def test_batch_size_search_disabled(self):
             yaml_str, expected_configs, pa_cli_args
         )
 
-    def test_batch_size_search_enabled(self):
-        """
-        Test Batch Size Search Enabled:
-            - Schmoo batch sizes
-            - Run Config Search enabled
-
-        Batch sizes: 1,2,4
-        Concurrency: log2(DEFAULT_RUN_CONFIG_MAX_CONCURRENCY)+1
-        """
-
-        # yapf: disable
-        yaml_str = ("""
-            profile_models:
-                - my-model
-            """)
-        # yapf: enable
-
-        batch_sizes = [1, 2, 4]
-        concurrencies = utils.generate_doubled_list(
-            1, DEFAULT_RUN_CONFIG_MAX_CONCURRENCY
-        )
-        expected_configs = [
-            construct_perf_analyzer_config(batch_size=b, concurrency=c)
-            for b in batch_sizes
-            for c in concurrencies
-        ]
-
-        pa_cli_args = ["-b 1,2,4"]
-        self._run_and_test_perf_analyzer_config_generator(
-            yaml_str, expected_configs, pa_cli_args
-        )
-
     def test_concurrency(self):
         """
         Test Concurrency:
@@ -242,16 +237,11 @@ def test_concurrency(self):
         and 4 configs will be generated
         """
 
-        # yapf: disable
-        yaml_str = ("""
-            profile_models:
-                - my-model
-            """)
-        # yapf: enable
+        yaml_str = _BASE_YAML
 
         concurrencies = [1, 2, 3, 4]
         expected_configs = [
-            construct_perf_analyzer_config(concurrency=c) for c in concurrencies
+            construct_perf_analyzer_config_dicts(concurrency=c) for c in concurrencies
         ]
 
         pa_cli_args = ["-c 1,2,3,4"]
@@ -277,18 +267,13 @@ def test_batch_size_and_concurrency(self):
         12 configs will be generated
         """
 
-        # yapf: disable
-        yaml_str = ("""
-            profile_models:
-                - my-model
-            """)
-        # yapf: enable
+        yaml_str = _BASE_YAML
 
         batch_sizes = [1, 2, 4]
         concurrencies = [1, 2, 3, 4]
 
         expected_configs = [
-            construct_perf_analyzer_config(batch_size=b, concurrency=c)
+            construct_perf_analyzer_config_dicts(batch_size=b, concurrency=c)
             for b in batch_sizes
             for c in concurrencies
         ]
@@ -313,19 +298,73 @@ def test_max_concurrency(self):
         and 5 configs (log2(16)+1) will be generated
         """
 
-        # yapf: disable
-        yaml_str = ("""
-            profile_models:
-                - my-model
-            """)
-        # yapf: enable
+        yaml_str = _BASE_YAML
 
         concurrencies = utils.generate_doubled_list(1, 16)
+        expected_configs = [self._PA_BY_CONCURRENCY[c] for c in concurrencies]
+
+        pa_cli_args = ["--run-config-search-max-concurrency", "16"]
+        self._run_and_test_perf_analyzer_config_generator(
+            yaml_str, expected_configs, pa_cli_args
+        )
+
+    def test_cpu_deployment_target(self):
+        """
+        Test CPU Deployment Target:
+            - The concurrency sweep is capped at DEFAULT_RUN_CONFIG_CPU_MAX_CONCURRENCY
+            - Unless max concurrency is specified
+
+        Default (1) value will be used for batch size
+        """
+
+        yaml_str = _BASE_YAML
+
+        concurrencies = utils.generate_doubled_list(
+            1, DEFAULT_RUN_CONFIG_CPU_MAX_CONCURRENCY
+        )
+        expected_configs = [self._PA_BY_CONCURRENCY[c] for c in concurrencies]
+
+        pa_cli_args = ["--run-config-search-deployment-target", "cpu"]
+        self._run_and_test_perf_analyzer_config_generator(
+            yaml_str, expected_configs, pa_cli_args
+        )
+
+        concurrencies = utils.generate_doubled_list(1, 64)
+        expected_configs = [self._PA_BY_CONCURRENCY[c] for c in concurrencies]
+
+        pa_cli_args = [
+            "--run-config-search-deployment-target",
+            "cpu",
+            "--run-config-search-max-concurrency",
+            "64",
+        ]
+        self._run_and_test_perf_analyzer_config_generator(
+            yaml_str, expected_configs, pa_cli_args
+        )
+
+    def test_saturation_prior_request_rate(self):
+        """
+        Test Saturation Prior with Request Rate:
+            - The request rate sweep does not go beyond four times the prior
+
+        Saturation Prior: 64
+        Default (1) value will be used for batch size
+        """
+
+        yaml_str = _BASE_YAML
+
         expected_configs = [
-            construct_perf_analyzer_config(concurrency=c) for c in concurrencies
+            construct_perf_analyzer_config_dicts(request_rate=request_rate)
+            for request_rate in utils.generate_doubled_list(
+                DEFAULT_RUN_CONFIG_MIN_REQUEST_RATE, 256
+            )
         ]
 
-        pa_cli_args = ["--run-config-search-max-concurrency", "16"]
+        pa_cli_args = [
+            "--request-rate-search-enable",
+            "--run-config-search-saturation-prior",
+            "64",
+        ]
         self._run_and_test_perf_analyzer_config_generator(
             yaml_str, expected_configs, pa_cli_args
         )
@@ -339,16 +378,11 @@ def test_min_concurrency(self):
         2 configs [5, 10] will be generated
         """
 
-        # yapf: disable
-        yaml_str = ("""
-            profile_models:
-                - my-model
-            """)
-        # yapf: enable
+        yaml_str = _BASE_YAML
 
         concurrencies = [5, 10]
         expected_configs = [
-            construct_perf_analyzer_config(concurrency=c) for c in concurrencies
+            construct_perf_analyzer_config_dicts(concurrency=c) for c in concurrencies
         ]
 
         pa_cli_args = [
@@ -372,16 +406,11 @@ def test_request_rate_list(self):
         and 4 configs will be generated
         """
 
-        # yapf: disable
-        yaml_str = ("""
-            profile_models:
-                - my-model
-            """)
-        # yapf: enable
+        yaml_str = _BASE_YAML
 
         request_rates = [1, 2, 3, 4]
         expected_configs = [
-            construct_perf_analyzer_config(request_rate=request_rate)
+            construct_perf_analyzer_config_dicts(request_rate=request_rate)
             for request_rate in request_rates
         ]
 
@@ -419,19 +448,11 @@ def test_request_rate_enable(self):
         Default (1) value will be used for batch size
         """
 
-        # yapf: disable
-        yaml_str = ("""
-            profile_models:
-                - my-model
-            """)
-        # yapf: enable
+        yaml_str = _BASE_YAML
 
-        request_rates = utils.generate_doubled_list(
-            DEFAULT_RUN_CONFIG_MIN_REQUEST_RATE, DEFAULT_RUN_CONFIG_MAX_REQUEST_RATE
-        )
         expected_configs = [
-            construct_perf_analyzer_config(request_rate=request_rate)
-            for request_rate in request_rates
+            construct_perf_analyzer_config_dicts(request_rate=request_rate)
+            for request_rate in self._DEFAULT_REQUEST_RATES
         ]
 
         pa_cli_args = ["--request-rate-search-enable"]
@@ -448,19 +469,14 @@ def test_max_request_rate(self):
         Default (1) value will be used for batch size
         """
 
-        # yapf: disable
-        yaml_str = ("""
-            profile_models:
-                - my-model
-            """)
-        # yapf: enable
+        yaml_str = _BASE_YAML
 
         request_rates = utils.generate_doubled_list(
             DEFAULT_RUN_CONFIG_MIN_REQUEST_RATE,
             int(DEFAULT_RUN_CONFIG_MAX_REQUEST_RATE / 2),
         )
         expected_configs = [
-            construct_perf_analyzer_config(request_rate=request_rate)
+            construct_perf_analyzer_config_dicts(request_rate=request_rate)
             for request_rate in request_rates
         ]
 
@@ -481,19 +497,14 @@ def test_min_request_rate(self):
         Default (1) value will be used for batch size
         """
 
-        # yapf: disable
-        yaml_str = ("""
-            profile_models:
-                - my-model
-            """)
-        # yapf: enable
+        yaml_str = _BASE_YAML
 
         request_rates = utils.generate_doubled_list(
             DEFAULT_RUN_CONFIG_MIN_REQUEST_RATE * 2,
             int(DEFAULT_RUN_CONFIG_MAX_REQUEST_RATE),
         )
         expected_configs = [
-            construct_perf_analyzer_config(request_rate=request_rate)
+            construct_perf_analyzer_config_dicts(request_rate=request_rate)
             for request_rate in request_rates
         ]
 
@@ -505,238 +516,88 @@ def test_min_request_rate(self):
             yaml_str, expected_configs, pa_cli_args
         )
 
-    def test_perf_analyzer_flags(self):
+    def test_early_exit(self):
         """
-        Test Perf Analyzer Flags:
-            - No CLI options specified
-            - Percentile (PA flag) set in model's YAML
-
-        Default (1) value will be used for batch size
-        and log2(DEFAULT_RUN_CONFIG_MAX_CONCURRENCY)+1 configs
-        will be generated by the auto-search
+        Test early exit on a throughput plateau:
+            - early_exit on, throughput still increasing: no early exit
+            - early_exit on, throughput plateaus: early exit
+            - early_exit off, throughput plateaus: no early exit
         """
 
-        # yapf: disable
-        yaml_str = ("""
-            profile_models:
-                - my-model:
-                    perf_analyzer_flags:
-                        percentile: 96
-            """)
-        # yapf: enable
+        yaml_str = _BASE_YAML
 
-        concurrencies = utils.generate_doubled_list(
-            1, DEFAULT_RUN_CONFIG_MAX_CONCURRENCY
-        )
-        expected_configs = [
-            construct_perf_analyzer_config(
-                concurrency=c, perf_analyzer_flags={"percentile": "96"}
-            )
-            for c in concurrencies
-        ]
-
-        self._run_and_test_perf_analyzer_config_generator(yaml_str, expected_configs)
-
-    def test_perf_analyzer_config_ssl_options(self):
-        """
-        Test Perf Analyzer SSL options:
-            - No CLI options specified
-        """
-
-        # yapf: disable
-        yaml_str = ("""
-            profile_models:
-                - my-model:
-                    perf_analyzer_flags:
-                        ssl-grpc-root-certifications-file: a
-                        ssl-grpc-private-key-file: b
-                        ssl-grpc-certificate-chain-file: c
-                        ssl-https-verify-peer: 1
-                        ssl-https-verify-host: 2
-                        ssl-https-ca-certificates-file: d
-                        ssl-https-client-certificate-type: e
-                        ssl-https-client-certificate-file: f
-                        ssl-https-private-key-type: g
-                        ssl-https-private-key-file: h
-            """)
-        # yapf: enable
+        increasing_throughputs = [2, 4, 8, 16, 32, 64, 128]
+        plateau_throughputs = [1, 2, 4, 4, 4, 4, 4]
 
-        concurrencies = utils.generate_doubled_list(
-            1, DEFAULT_RUN_CONFIG_MAX_CONCURRENCY
-        )
-        expected_configs = [
-            construct_perf_analyzer_config(
-                concurrency=c,
-                perf_analyzer_flags={
-                    "ssl-grpc-root-certifications-file": "a",
-                    "ssl-grpc-private-key-file": "b",
-                    "ssl-grpc-certificate-chain-file": "c",
-                    "ssl-https-verify-peer": "1",
-                    "ssl-https-verify-host": "2",
-                    "ssl-https-ca-certificates-file": "d",
-                    "ssl-https-client-certificate-type": "e",
-                    "ssl-https-client-certificate-file": "f",
-                    "ssl-https-private-key-type": "g",
-                    "ssl-https-private-key-file": "h",
-                },
-            )
-            for c in concurrencies
-        ]
-
-        self._run_and_test_perf_analyzer_config_generator(yaml_str, expected_configs)
-
-    def test_early_exit_on_no_plateau(self):
-        """
-        Test if early_exit is true but the throughput is still increasing, we
-        do not early exit
-        """
-        # yapf: disable
-        yaml_str = ("""
-            profile_models:
-                - my-model
-            """)
-        # yapf: enable
-
-        concurrencies = utils.generate_doubled_list(1, 64)
-        expected_configs = [
-            construct_perf_analyzer_config(concurrency=c) for c in concurrencies
-        ]
-
-        pa_cli_args = ["--run-config-search-max-concurrency", "64"]
-        self._run_and_test_perf_analyzer_config_generator(
-            yaml_str, expected_configs, pa_cli_args, early_exit=True
-        )
-
-    def test_early_exit_on_yes_plateau(self):
-        """
-        Test if early_exit is true and the throughput plateaus, we do early exit
-        """
-
-        # yapf: disable
-        yaml_str = ("""
-            profile_models:
-                - my-model
-            """)
-        # yapf: enable
-
-        concurrencies = utils.generate_doubled_list(1, 32)
-        expected_configs = [
-            construct_perf_analyzer_config(concurrency=c) for c in concurrencies
-        ]
-
-        pa_cli_args = ["--run-config-search-max-concurrency", "64"]
-        with patch.object(
-            TestPerfAnalyzerConfigGenerator, "_get_next_perf_throughput_value"
-        ) as mock_method:
-            mock_method.side_effect = [1, 2, 4, 4, 4, 4, 4]
-            self._run_and_test_perf_analyzer_config_generator(
-                yaml_str, expected_configs, pa_cli_args, early_exit=True
-            )
-
-    def test_early_exit_off_yes_plateau(self):
-        """
-        Test if early_exit is off and the throughput plateaus, we do not early exit
-        """
-
-        # yapf: disable
-        yaml_str = ("""
-            profile_models:
-                - my-model
-            """)
-        # yapf: enable
-
-        concurrencies = utils.generate_doubled_list(1, 64)
-        expected_configs = [
-            construct_perf_analyzer_config(concurrency=c) for c in concurrencies
+        # (name, early_exit, throughputs, last expected concurrency)
+        cases = [
+            ("on_no_plateau", True, increasing_throughputs, 64),
+            ("on_yes_plateau", True, plateau_throughputs, 32),
+            ("off_yes_plateau", False, plateau_throughputs, 64),
         ]
 
         pa_cli_args = ["--run-config-search-max-concurrency", "64"]
-        with patch.object(
-            TestPerfAnalyzerConfigGenerator, "_get_next_perf_throughput_value"
-        ) as mock_method:
-            mock_method.side_effect = [1, 2, 4, 4, 4, 4, 4]
-            self._run_and_test_perf_analyzer_config_generator(
-                yaml_str, expected_configs, pa_cli_args, early_exit=False
-            )
+        try:
+            for name, early_exit, throughputs, max_concurrency in cases:
+                with self.subTest(name=name):
+                    # Shadow the method on this instance with the fixed sequence
+                    self._get_next_perf_throughput_value = iter(throughputs).__next__
+
+                    concurrencies = utils.generate_doubled_list(1, max_concurrency)
+                    expected_configs = [
+                        self._PA_BY_CONCURRENCY[c] for c in concurrencies
+                    ]
+
+                    self._run_and_test_perf_analyzer_config_generator(
+                        yaml_str, expected_configs, pa_cli_args, early_exit=early_exit
+                    )
+        finally:
+            del self._get_next_perf_throughput_value
 
     def test_throughput_gain_based_on_max(self):
-        # Expect false because no increases
-        throughput_values = [50, 40, 30, 20]
-        expected_result = False
-        self._test_throughput_gain_valid_helper(throughput_values, expected_result)
-
-        # Expect false because no increases in the last 4
-        throughput_values = [10, 20, 30, 40, 50, 40, 30, 20]
-        expected_result = False
-        self._test_throughput_gain_valid_helper(throughput_values, expected_result)
-
-        # Expect false because gain is only 5%
-        throughput_values = [50, 50, 50, 52.5]
-        expected_result = False
-        self._test_throughput_gain_valid_helper(throughput_values, expected_result)
-
-        # Expect false because gain is only 5%
-        throughput_values = [50, 35, 45, 51.5]
-        expected_result = False
-        self._test_throughput_gain_valid_helper(throughput_values, expected_result)
-
-        # Expect true because gain is more than 5%
-        throughput_values = [50, 50, 50, 52.51]
-        expected_result = True
-        self._test_throughput_gain_valid_helper(throughput_values, expected_result)
-
-        # Expect true because not enough data
-        throughput_values = [50, 10]
-        expected_result = True
-        self._test_throughput_gain_valid_helper(throughput_values, expected_result)
-
-        # Expect true because of increases
-        throughput_values = [50, 100, 200, 400]
-        expected_result = True
-        self._test_throughput_gain_valid_helper(throughput_values, expected_result)
-
-        # Expect false because no new max
-        throughput_values = [50, 10, 50, 10]
-        expected_result = False
-        self._test_throughput_gain_valid_helper(throughput_values, expected_result)
-
-    def _test_throughput_gain_valid_helper(self, throughput_values, expected_result):
-        throughputs = [
-            construct_run_config_measurement(
-                model_name=MagicMock(),
-                model_config_names=["test_model_config_name"],
-                model_specific_pa_params=MagicMock(),
-                gpu_metric_values=MagicMock(),
-                non_gpu_metric_values=[{"perf_throughput": throughput_value}],
-            )
-            for throughput_value in throughput_values
+        # (throughput values, expected result)
+        cases = [
+            # Expect false because no increases
+            ([50, 40, 30, 20], False),
+            # Expect false because no increases in the last 4
+            ([10, 20, 30, 40, 50, 40, 30, 20], False),
+            # Expect false because gain is only 5%
+            ([50, 50, 50, 52.5], False),
+            # Expect false because gain is only 5%
+            ([50, 35, 45, 51.5], False),
+            # Expect true because gain is more than 5%
+            ([50, 50, 50, 52.51], True),
+            # Expect true because not enough data
+            ([50, 10], True),
+            # Expect true because of increases
+            ([50, 100, 200, 400], True),
+            # Expect false because no new max
+            ([50, 10, 50, 10], False),
         ]
 
-        result = PerfAnalyzerConfigGenerator.throughput_gain_valid_helper(
-            throughputs=throughputs, min_tries=4, min_gain=0.05
-        )
+        for throughput_values, expected_result in cases:
+            with self.subTest(throughput_values=throughput_values):
+                throughputs = [make_fast_measurement(v) for v in throughput_values]
+
+                result = PerfAnalyzerConfigGenerator.throughput_gain_valid_helper(
+                    throughputs=throughputs, min_tries=4, min_gain=0.05
+                )
 
-        self.assertEqual(result, expected_result)
+                self.assertEqual(result, expected_result)
 
     def _get_next_measurement(self):
         throughput_value = self._get_next_perf_throughput_value()
         if throughput_value is None:
             return None
         else:
-            return construct_run_config_measurement(
-                model_name=MagicMock(),
-                model_config_names=["test_model_config_name"],
-                model_specific_pa_params=MagicMock(),
-                gpu_metric_values=MagicMock(),
-                non_gpu_metric_values=[{"perf_throughput": throughput_value}],
-            )
+            return make_fast_measurement(throughput_value)
 
     def _get_next_perf_throughput_value(self):
         self._perf_throughput *= 2
         return self._perf_throughput
 
     def _run_and_test_perf_analyzer_config_generator(
-        self, yaml_str, expected_configs, pa_cli_args=None, early_exit=False
+        self, yaml_str, expected_configs, pa_cli_args=(), early_exit=False
     ):
         args = [
             "model-analyzer",
@@ -747,12 +608,9 @@ def _run_and_test_perf_analyzer_config_generator(
             "path-to-config-file",
         ]
 
-        if type(pa_cli_args) == list:
-            args = args + pa_cli_args
-        elif type(pa_cli_args) == str:
-            args.append(pa_cli_args)
+        args.extend(pa_cli_args)
 
-        config = evaluate_mock_config(args, yaml_str, subcommand="profile")
+        config = _evaluate_mock_config(tuple(args), yaml_str)
 
         pacg = PerfAnalyzerConfigGenerator(
             config,
@@ -762,78 +620,52 @@ def _run_and_test_perf_analyzer_config_generator(
             early_exit,
         )
 
-        perf_analyzer_configs = []
-        for perf_config in pacg.get_configs():
-            perf_analyzer_configs.append(perf_config)
-            pacg.set_last_results([self._get_next_measurement()])
-
-        self.assertEqual(len(expected_configs), len(perf_analyzer_configs))
-        for i in range(len(expected_configs)):
-            self.assertEqual(
-                expected_configs[i]._options["-m"],
-                perf_analyzer_configs[i]._options["-m"],
-            )
-            self.assertEqual(
-                expected_configs[i]._options["-b"],
-                perf_analyzer_configs[i]._options["-b"],
-            )
-            self.assertEqual(
-                expected_configs[i]._options["-i"],
-                perf_analyzer_configs[i]._options["-i"],
-            )
+        for i, (expected_config, perf_config) in enumerate(
+            zip_longest(expected_configs, pacg.get_configs())
+        ):
+            self.assertIsNotNone(perf_config, f"Missing generated config {i}")
+            self.assertIsNotNone(expected_config, f"Unexpected generated config {i}")
             self.assertEqual(
-                expected_configs[i]._options["-u"],
-                perf_analyzer_configs[i]._options["-u"],
+                expected_config,
+                (perf_config._options, perf_config._args, perf_config._additive_args),
+                f"Mismatch in generated config {i}",
             )
+            pacg.set_last_results([self._get_next_measurement()])
 
-            self.assertEqual(
-                expected_configs[i]._args["concurrency-range"],
-                perf_analyzer_configs[i]._args["concurrency-range"],
-            )
-            self.assertEqual(
-                expected_configs[i]._args["measurement-mode"],
-                perf_analyzer_configs[i]._args["measurement-mode"],
-            )
-            self.assertEqual(
-                expected_configs[i]._args["service-kind"],
-                perf_analyzer_configs[i]._args["service-kind"],
-            )
-            self.assertEqual(
-                expected_configs[i]._args["triton-server-directory"],
-                perf_analyzer_configs[i]._args["triton-server-directory"],
-            )
-            self.assertEqual(
-                expected_configs[i]._args["model-repository"],
-                perf_analyzer_configs[i]._args["model-repository"],
-            )
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
 
-            # Future-proofing (in case a new field gets added)
-            self.assertEqual(
-                expected_configs[i]._options, perf_analyzer_configs[i]._options
-            )
-            self.assertEqual(expected_configs[i]._args, perf_analyzer_configs[i]._args)
-            self.assertEqual(
-                expected_configs[i]._additive_args,
-                perf_analyzer_configs[i]._additive_args,
+        cls._DEFAULT_CONCURRENCIES = tuple(
+            utils.generate_doubled_list(1, DEFAULT_RUN_CONFIG_MAX_CONCURRENCY)
+        )
+        cls._DEFAULT_REQUEST_RATES = tuple(
+            utils.generate_doubled_list(
+                DEFAULT_RUN_CONFIG_MIN_REQUEST_RATE, DEFAULT_RUN_CONFIG_MAX_REQUEST_RATE
             )
+        )
+        cls._PA_BY_CONCURRENCY = {
+            c: construct_perf_analyzer_config_dicts(concurrency=c)
+            for c in cls._DEFAULT_CONCURRENCIES
+        }
 
-    def setUp(self):
         # Mock path validation
-        self.mock_os = MockOSMethods(
+        cls.mock_os = MockOSMethods(
             mock_paths=["model_analyzer.config.input.config_utils"]
         )
-        self.mock_os.start()
+        cls.mock_os.start()
 
-    def tearDown(self):
-        self.mock_os.stop()
-        patch.stopall()
+    @classmethod
+    def tearDownClass(cls):
+        cls.mock_os.stop()
+        super().tearDownClass()
 
     def make_multi_model_measurement(self, model_names, non_gpu_metric_values):
         return construct_run_config_measurement(
-            model_name=MagicMock(),
+            model_name=_UNUSED,
             model_config_names=model_names,
-            model_specific_pa_params=MagicMock(),
-            gpu_metric_values=MagicMock(),
+            model_specific_pa_params=[_UNUSED] * len(model_names),
+            gpu_metric_values={},
             non_gpu_metric_values=non_gpu_metric_values,
         )
 
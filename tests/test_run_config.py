@@ -207,6 +207,30 @@ def test_composing_mrc_with_illegal_combinations(self):
 
         self.assertFalse(mrc.is_legal_combination())
 
+    def test_copy_for_parameter_sweep(self):
+        """
+        Test that copy_for_parameter_sweep() shares the model config variants,
+        but that changing the copy's perf config does not change the original
+        """
+        pc = PerfAnalyzerConfig()
+        pc.update_config({"model-name": "TestModel1", "concurrency-range": 1})
+        mcv = ModelConfigVariant(MagicMock(), "model1_config_0")
+        mrc = ModelRunConfig("model1", mcv, pc)
+        rc = RunConfig({"a": 5})
+        rc.add_model_run_config(mrc)
+
+        rc_copy = rc.copy_for_parameter_sweep()
+        mrc_copy = rc_copy.model_run_configs()[0]
+
+        self.assertEqual(rc_copy.triton_environment(), rc.triton_environment())
+        self.assertEqual(rc_copy.representation(), rc.representation())
+        self.assertIs(mrc_copy.model_config_variant(), mcv)
+        self.assertIsNot(mrc_copy.perf_config(), pc)
+
+        mrc_copy.perf_config().update_config({"concurrency-range": 16})
+        self.assertEqual(mrc_copy.perf_config()["concurrency-range"], 16)
+        self.assertEqual(pc["concurrency-range"], 1)
+
 
 if __name__ == "__main__":
     unittest.main()